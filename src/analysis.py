@@ -1,17 +1,23 @@
 """
 Text-to-signal conversion:
- - Use TF-IDF to vectorize tweet content
+ - Use TF-IDF to vectorize tweet content (term counts cached per content hash)
  - Dimensionality reduction with TruncatedSVD
  - Generate composite trading signal with confidence
 """
 import pandas as pd
-from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.feature_extraction.text import TfidfTransformer
 from sklearn.decomposition import TruncatedSVD
 import numpy as np
 
+from .feature_store import FeatureStore
 
-def compute_tfidf_signals(df, n_components=50):
-    """Compute TF-IDF signals from tweet DataFrame."""
+
+def compute_tfidf_signals(df, n_components=50, max_features=5000, feature_store=None):
+    """Compute TF-IDF signals from tweet DataFrame.
+
+    Term counts are looked up in feature_store (an in-memory FeatureStore
+    if None) so only content not seen before is tokenized.
+    """
     # Handle empty DataFrame
     if len(df) == 0 or "content" not in df.columns:
         return pd.DataFrame({
@@ -23,8 +29,15 @@ def compute_tfidf_signals(df, n_components=50):
     
     texts = df["content"].fillna("")
 
-    vect = TfidfVectorizer(max_features=5000, ngram_range=(1, 2))
-    X = vect.fit_transform(texts)
+    if feature_store is None:
+        feature_store = FeatureStore(path=None)
+    counts = feature_store.transform(texts)
+
+    # keep the most frequent terms in this batch, as TfidfVectorizer(max_features)
+    term_freq = np.asarray(counts.sum(axis=0)).ravel()
+    top = np.argsort(-term_freq, kind="stable")[:max_features]
+    top = np.sort(top[term_freq[top] > 0])
+    X = TfidfTransformer().fit_transform(counts[:, top])
 
     # reduce dimensionality
     svd = TruncatedSVD(n_components=n_components, random_state=42)
@@ -49,6 +62,8 @@ def compute_tfidf_signals(df, n_components=50):
 
 if __name__ == "__main__":
     df = pd.read_parquet("data/tweets.parquet")
-    signals = compute_tfidf_signals(df)
+    store = FeatureStore()
+    signals = compute_tfidf_signals(df, feature_store=store)
+    store.save()
     signals.to_parquet("data/signals.parquet")
     print("Wrote data/signals.parquet")
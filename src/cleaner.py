@@ -28,6 +28,11 @@ def compute_hash(row):
     return hashlib.sha256(key.encode("utf-8")).hexdigest()
 
 
+def compute_content_hash(text):
+    """Compute hash from content alone so retweets/copies share one key."""
+    return hashlib.sha256(normalize_text(text).encode("utf-8")).hexdigest()
+
+
 def to_dataframe(records):
     """Convert list of dicts -> pandas DataFrame with cleaning + deduplication."""
     df = pd.DataFrame(records)
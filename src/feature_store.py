@@ -0,0 +1,171 @@
+"""
+Feature cache keyed by content hash:
+ - Hashed 1-2 gram term counts per unique tweet content
+ - Only cache misses are tokenized and vectorized
+ - Persisted as memory-mappable CSR arrays (.npy), committed via meta.json
+ - LRU eviction once max_entries is exceeded
+"""
+import json
+import os
+import uuid
+from collections import OrderedDict
+
+import numpy as np
+import scipy.sparse as sp
+from sklearn.feature_extraction.text import HashingVectorizer
+
+from .cleaner import compute_content_hash
+
+DEFAULT_DIR = "data/features"
+N_FEATURES = 2**18
+NGRAM_RANGE = (1, 2)
+
+
+class FeatureStore:
+    """Content-hash -> sparse term-count row cache with LRU eviction.
+
+    Term counts are corpus-independent, so they can be reused across batches;
+    IDF weighting and SVD are fit per batch by the caller.
+    Pass path=None for an in-memory store that is never persisted.
+    """
+
+    def __init__(self, path=DEFAULT_DIR, max_entries=500_000, n_features=N_FEATURES):
+        self.path = path
+        self.max_entries = max_entries
+        self.n_features = n_features
+        self.vectorizer = HashingVectorizer(
+            n_features=n_features,
+            ngram_range=NGRAM_RANGE,
+            alternate_sign=False,
+            norm=None,
+        )
+        # content hash -> (indices, data); views into mmapped arrays after load
+        self._rows = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        if path is not None:
+            self._load()
+
+    def __len__(self):
+        return len(self._rows)
+
+    def _meta(self):
+        return {"n_features": self.n_features, "ngram_range": list(NGRAM_RANGE)}
+
+    def _load(self):
+        """Load a persisted store, memory-mapping its arrays.
+
+        Any missing, stale or inconsistent generation drops the cache.
+        """
+        try:
+            with open(os.path.join(self.path, "meta.json")) as f:
+                meta = json.load(f)
+            generation = meta.pop("generation")
+            if meta != self._meta():
+                # vectorizer settings changed, cached rows are stale
+                return
+            keys = self._load_array("keys", generation)
+            indptr = self._load_array("indptr", generation)
+            indices = self._load_array("indices", generation)
+            data = self._load_array("data", generation)
+        except (OSError, ValueError, KeyError, AttributeError):
+            return
+        if (
+            len(indptr) != len(keys) + 1
+            or indptr[0] != 0
+            or indptr[-1] != len(indices)
+            or len(indices) != len(data)
+        ):
+            return
+        for i, key in enumerate(keys):
+            start, end = indptr[i], indptr[i + 1]
+            self._rows[key.decode("ascii")] = (indices[start:end], data[start:end])
+
+    def _array_path(self, name, generation):
+        return os.path.join(self.path, f"{name}.{generation}.npy")
+
+    def _load_array(self, name, generation):
+        return np.load(self._array_path(name, generation), mmap_mode="r")
+
+    def save(self):
+        """Persist the store (least recently used first) as CSR .npy arrays.
+
+        Arrays are written under a fresh generation id and meta.json is
+        replaced last, so an interrupted save leaves the previous store intact.
+        """
+        if self.path is None:
+            return
+        os.makedirs(self.path, exist_ok=True)
+        keys = list(self._rows)
+        rows = list(self._rows.values())
+        indptr, indices, data = _stack(rows)
+        # re-point rows at the new arrays so no old mmap is held open
+        self._rows = OrderedDict(
+            (key, (indices[indptr[i] : indptr[i + 1]], data[indptr[i] : indptr[i + 1]]))
+            for i, key in enumerate(keys)
+        )
+        arrays = {
+            "keys": np.array(keys, dtype="S64"),
+            "indptr": indptr,
+            "indices": indices,
+            "data": data,
+        }
+        generation = uuid.uuid4().hex
+        for name, arr in arrays.items():
+            np.save(self._array_path(name, generation), arr)
+        meta_path = os.path.join(self.path, "meta.json")
+        with open(meta_path + ".tmp", "w") as f:
+            json.dump(dict(self._meta(), generation=generation), f)
+        os.replace(meta_path + ".tmp", meta_path)
+
+        # drop arrays from earlier or interrupted saves
+        for fname in os.listdir(self.path):
+            if fname.endswith(".npy") and f".{generation}." not in fname:
+                try:
+                    os.remove(os.path.join(self.path, fname))
+                except OSError:
+                    pass
+
+    def transform(self, texts):
+        """Return a CSR term-count matrix for texts, vectorizing only misses."""
+        texts = [t if isinstance(t, str) else "" for t in texts]
+        keys = [compute_content_hash(t) for t in texts]
+
+        missing = {}
+        for key, text in zip(keys, texts):
+            if key in self._rows:
+                self._rows.move_to_end(key)
+            elif key not in missing:
+                missing[key] = text
+        self.misses += len(missing)
+        self.hits += len(keys) - len(missing)
+
+        if missing:
+            X = self.vectorizer.transform(list(missing.values()))
+            X.sort_indices()
+            for i, key in enumerate(missing):
+                start, end = X.indptr[i], X.indptr[i + 1]
+                self._rows[key] = (
+                    X.indices[start:end].astype(np.int32),
+                    X.data[start:end].astype(np.float32),
+                )
+
+        # gather before evicting so this batch never loses its own rows
+        indptr, indices, data = _stack([self._rows[key] for key in keys])
+        while len(self._rows) > self.max_entries:
+            self._rows.popitem(last=False)
+
+        return sp.csr_matrix(
+            (data, indices, indptr), shape=(len(keys), self.n_features)
+        )
+
+
+def _stack(rows):
+    """Concatenate (indices, data) rows into CSR indptr/indices/data arrays."""
+    indptr = np.zeros(len(rows) + 1, dtype=np.int64)
+    if not rows:
+        return indptr, np.empty(0, dtype=np.int32), np.empty(0, dtype=np.float32)
+    np.cumsum([len(idx) for idx, _ in rows], out=indptr[1:])
+    indices = np.concatenate([idx for idx, _ in rows]).astype(np.int32, copy=False)
+    data = np.concatenate([val for _, val in rows]).astype(np.float32, copy=False)
+    return indptr, indices, data
@@ -12,6 +12,7 @@ from .mock_data import generate_mock_tweets
 from .cleaner import to_dataframe
 from .storage import append_parquet, write_parquet
 from .analysis import compute_tfidf_signals
+from .feature_store import FeatureStore
 from .utils import configure_logging
 import logging
 
@@ -41,7 +42,11 @@ async def main_async():
     append_parquet(df, path='data/tweets.parquet')
     logger.info('Wrote data/tweets.parquet')
 
-    signals = compute_tfidf_signals(df)
+    store = FeatureStore()
+    signals = compute_tfidf_signals(df, feature_store=store)
+    store.save()
+    logger.info(f'Feature cache: {store.hits} hits, {store.misses} misses')
+
     write_parquet(signals, path='data/signals.parquet')
     logger.info('Wrote data/signals.parquet')
 